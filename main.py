@@ -1,16 +1,23 @@
 import os
 import signal
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from modules.audio_listener import AudioListener
+from modules.grpc_channels import close_channel_pools
 from modules.logger import TranscriptionLogger
 from modules.model_selector import AVAILABLE_MODELS
 from modules.translate import EnglishToSpanishTranslator
 from view.page import Page
 
 TARGET_LANG = os.getenv("DESKTOP_TARGET_LANG", "es")
+PARTIAL_DEBOUNCE_SECONDS = 0.05
+
+_MODEL_NAME_TO_LANG = {info["name"]: info.get("code", "en") for info in AVAILABLE_MODELS.values()}
 
 translator: Optional[EnglishToSpanishTranslator] = None
 listener: Optional[AudioListener] = None
@@ -18,19 +25,29 @@ page: Optional[Page] = None
 logger: Optional[TranscriptionLogger] = None
 _closing = False
 
+# Partial debounce state: growing partials within the window are coalesced and the
+# latest one is flushed on the trailing edge by a single long-lived thread.
+_partial_cv = threading.Condition()
+_last_enqueue_time = 0.0
+_last_enqueue_text = ""
+_pending_partial: Optional[str] = None
+_pending_deadline = 0.0
+_partial_thread: Optional[threading.Thread] = None
+
+# Finals are translated here instead of on the STT receive thread; one worker keeps them in order.
+_final_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="final-translate")
+
 
 def _resolve_source_lang(model_path: str) -> str:
-    model_name = Path(model_path).name
-    for info in AVAILABLE_MODELS.values():
-        if info["name"] == model_name:
-            return info.get("code", "en")
-    return "en"
+    return _MODEL_NAME_TO_LANG.get(Path(model_path).name, "en")
 
 
 def _reset_translator(source_lang: str):
     global translator
 
     if translator:
+        if translator.source_lang == source_lang:
+            return
         translator.close()
 
     translator = EnglishToSpanishTranslator(source_lang=source_lang, target_lang=TARGET_LANG)
@@ -40,27 +57,102 @@ def _reset_translator(source_lang: str):
     )
 
 
-def on_final(text: str, confidence: float):
-    translated = text
+def _enqueue_partial(text: str):
+    global _last_enqueue_time, _last_enqueue_text
+
     if translator:
-        translated = translator.translate(text)
+        translator.enqueue(text)
+    _last_enqueue_time = time.monotonic()
+    _last_enqueue_text = text
 
-    page.add_traduction(text, translated, confidence)
 
-    if logger:
-        logger.log(text, translated)
+def _partial_debounce_loop():
+    global _pending_partial
+
+    with _partial_cv:
+        while not _closing:
+            if _pending_partial is None:
+                _partial_cv.wait()
+                continue
+            remaining = _pending_deadline - time.monotonic()
+            if remaining > 0:
+                _partial_cv.wait(remaining)
+                continue
+            text = _pending_partial
+            _pending_partial = None
+            _enqueue_partial(text)
+
+
+def _start_partial_debounce():
+    global _partial_thread
+
+    if _partial_thread is None:
+        _partial_thread = threading.Thread(target=_partial_debounce_loop, name="partial-debounce", daemon=True)
+        _partial_thread.start()
+
+
+def _cancel_pending_partial():
+    global _pending_partial
+
+    with _partial_cv:
+        _pending_partial = None
+
+
+def _publish_final(text: str, confidence: float, translation=None, final_translator=None):
+    try:
+        translated = text
+        if final_translator:
+            translated = final_translator.translate_result(translation, text)
+
+        page.add_traduction(text, translated, confidence)
 
+        if logger:
+            logger.log(text, translated)
+
+        print(f"[{confidence:.2f}] {text}")
+    except Exception:
+        print("Error publicando texto final:")
+        traceback.print_exc()
+
+
+def on_final(text: str, confidence: float):
+    _cancel_pending_partial()
+    # Cleared here, on the STT receive thread, rather than when the translation is
+    # published: by then the next utterance's partials may already be on screen.
     page.clear_current_text()
-    print(f"[{confidence:.2f}] {text}")
+    # Start the RPC now so back-to-back finals are translated concurrently; the
+    # executor still publishes them in order.
+    final_translator = translator
+    translation = None
+    if final_translator:
+        try:
+            translation = final_translator.translate_async(text)
+        except Exception:
+            print("Error iniciando traducción:")
+            traceback.print_exc()
+    try:
+        _final_executor.submit(_publish_final, text, confidence, translation, final_translator)
+    except RuntimeError:
+        pass  # Executor already shut down during app close
 
 
 def on_partial(text: str):
-    if translator:
-        translator.enqueue(text)
+    global _pending_partial, _pending_deadline
+
+    if not translator:
+        return
 
+    with _partial_cv:
+        elapsed = time.monotonic() - _last_enqueue_time
+        if elapsed < PARTIAL_DEBOUNCE_SECONDS and text.startswith(_last_enqueue_text):
+            if _pending_partial is None:
+                _pending_deadline = _last_enqueue_time + PARTIAL_DEBOUNCE_SECONDS
+                _partial_cv.notify()
+            _pending_partial = text
+            return
 
-def on_current(text: str):
-    _ = text
+        _pending_partial = None
+        _enqueue_partial(text)
 
 
 def on_audio_level(level: float):
@@ -74,8 +166,15 @@ def start_listener(model_path: str, device_id: int, latency: float = 0.05):
     page.set_status("⏳ Conectando a servicios gRPC...", "orange")
     page.root.update()
 
+    # Keep the STT stream open when the model is unchanged; AudioListener
+    # drops it if the new device needs a different sample rate.
+    previous_strategy = None
     if listener:
-        listener.stop()
+        keep_stream = listener.model_path == model_path
+        listener.stop(close_strategy=not keep_stream)
+        if keep_stream:
+            previous_strategy = listener.strategy
+        listener = None
 
     try:
         source_lang = _resolve_source_lang(model_path)
@@ -85,16 +184,18 @@ def start_listener(model_path: str, device_id: int, latency: float = 0.05):
             model_path=model_path,
             device_id=device_id,
             latency=latency,
+            strategy=previous_strategy,
         )
         listener.set_on_final(on_final)
         listener.set_on_partial(on_partial)
-        listener.set_on_current(on_current)
         listener.set_on_audio_level(on_audio_level)
         listener.listen_in_thread()
 
         page.set_status(f"🎙️ Escuchando por gRPC... (Latencia: {latency:.2f}s)", "green")
         print(f"Escuchando... model={model_path} device={device_id} latency={latency}")
     except Exception as e:
+        if listener is None and previous_strategy:
+            previous_strategy.close()
         page.set_status(f"❌ Error: {str(e)[:60]}", "red")
         print(f"Error iniciando listener: {e}")
 
@@ -109,6 +210,8 @@ def on_app_close():
     if _closing:
         return
     _closing = True
+    with _partial_cv:
+        _partial_cv.notify()
 
     # During shutdown, ignore extra Ctrl+C to avoid noisy atexit traces.
     try:
@@ -125,6 +228,8 @@ def on_app_close():
         finally:
             listener = None
 
+    _final_executor.shutdown(wait=False, cancel_futures=True)
+
     if translator:
         try:
             translator.close()
@@ -134,6 +239,11 @@ def on_app_close():
         finally:
             translator = None
 
+    if logger:
+        logger.close()
+
+    close_channel_pools()
+
 
 def main():
     global page, logger, _closing
@@ -145,6 +255,7 @@ def main():
     page = Page(title="Traductor Desktop (gRPC)")
     page.set_on_config_change(on_config_change)
     page.set_on_close(on_app_close)
+    _start_partial_debounce()
 
     model_path = page.get_selected_model_path()
     device_id = page.get_selected_device_id()
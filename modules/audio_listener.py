@@ -1,7 +1,9 @@
 """Desktop audio listener that streams microphone audio to gRPC STT."""
 
-import queue
+import math
+import os
 import threading
+import time
 import traceback
 from typing import Callable, Optional
 
@@ -10,6 +12,25 @@ import sounddevice as sd
 
 from modules.grpc_stt import GrpcSttStrategy
 
+# The level meter only needs a coarse estimate; sample every Nth frame.
+LEVEL_STRIDE = 4
+# Measure the level on every Nth block only and smooth it so the meter does not flicker.
+LEVEL_EVERY_N_BLOCKS = 3
+LEVEL_EMA_ALPHA = 0.3
+# Preallocated capture slots between the PortAudio callback and the consumer (power of two).
+RING_SLOTS = 16
+RING_MASK = RING_SLOTS - 1
+# Mean-abs level (0.0-1.0) under which a block counts as silence; 0 disables the gate.
+SILENCE_GATE_LEVEL = float(os.getenv("STT_SILENCE_GATE_LEVEL", "0.002"))
+# Trailing silence still streamed after speech so the STT service can endpoint the utterance.
+SILENCE_HANGOVER_SECONDS = 1.5
+# Upper bound of backlogged audio merged into a single STT request.
+MAX_BATCH_SECONDS = 0.2
+# The callback and stop() set the ready event, so the consumer can sleep long between utterances.
+IDLE_WAIT_SECONDS = 5.0
+# Minimum pause between attempts to reopen an STT stream that ended (e.g. service restarted).
+STREAM_RETRY_SECONDS = 1.0
+
 
 class AudioListener:
     def __init__(
@@ -21,6 +42,7 @@ class AudioListener:
         dtype: str = "int16",
         device_id: int = None,
         latency: float = 0.05,
+        strategy: Optional[GrpcSttStrategy] = None,
     ):
         self.device_id = device_id
         self.model_path = model_path
@@ -31,17 +53,60 @@ class AudioListener:
         else:
             self.sample_rate = sample_rate
 
-        self.block_size = block_size if block_size is not None else int(self.sample_rate * latency)
+        if block_size is None:
+            # Align to whole 10 ms frames (the STT decoder's stride); round() absorbs float error
+            # from the latency slider (e.g. 0.29 * 16000 = 4639.99...).
+            frame = max(self.sample_rate // 100, 1)
+            block_size = max(frame, round(self.sample_rate * latency / frame) * frame)
+        self.block_size = block_size
         self.channels = channels
         self.dtype = dtype
 
-        self.q: queue.Queue[bytes] = queue.Queue(maxsize=20)
+        # Single-producer/single-consumer ring: the callback copies into a free slot
+        # without allocating, the listen loop drains slots in order.
+        slot_bytes = self.block_size * channels * np.dtype(dtype).itemsize
+        self._slots = [bytearray(slot_bytes) for _ in range(RING_SLOTS)]
+        self._slot_lens = [0] * RING_SLOTS
+        # Strided int16 views over each slot, built once, so measuring a full block creates no arrays
+        self._slot_bytes = slot_bytes
+        self._level_views = [np.frombuffer(buf, dtype=np.int16)[::LEVEL_STRIDE] for buf in self._slots]
+        self._write_idx = 0
+        self._read_idx = 0
+        self._data_ready = threading.Event()
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._on_audio_level: Optional[Callable[[float], None]] = None
+        # int32 scratch so abs() of -32768 cannot overflow and no temporary is allocated per block
+        self._level_scratch = np.empty(self._level_views[0].size, dtype=np.int32)
+        self._level_countdown = 0
+        self._level_ema = 0.0
+
+        # Silence gate: after the hangover, silent blocks are held back instead of streamed;
+        # the last one is kept as pre-roll so the speech onset is not clipped.
+        self._hangover_blocks = math.ceil(SILENCE_HANGOVER_SECONDS * self.sample_rate / max(self.block_size, 1))
+        self._silent_blocks = 0
+        self._preroll: Optional[bytes] = None
+
+        # Blocks waiting to be sent; only grows while the consumer catches up on a backlog.
+        self._batch: list[bytes] = []
+        self._batch_bytes = 0
+        self._batch_limit = int(self.sample_rate * MAX_BATCH_SECONDS) * channels * np.dtype(dtype).itemsize
+        self._last_stream_retry = 0.0
 
-        self.strategy = GrpcSttStrategy(strategy="vosk", model_path=model_path)
-        self.strategy.initialize(model_path=model_path, sample_rate=self.sample_rate)
+        # Reuse a still-open stream from a previous listener when it was configured for the
+        # same model and sample rate (e.g. only the device or latency changed).
+        if (
+            strategy is not None
+            and strategy.is_active
+            and strategy.model_path == model_path
+            and strategy.sample_rate == self.sample_rate
+        ):
+            self.strategy = strategy
+        else:
+            if strategy is not None:
+                strategy.close()
+            self.strategy = GrpcSttStrategy(strategy="vosk", model_path=model_path)
+            self.strategy.initialize(model_path=model_path, sample_rate=self.sample_rate)
 
     def set_on_final(self, callback: Callable[[str, float], None]):
         self.strategy.set_on_final(callback)
@@ -59,23 +124,109 @@ class AudioListener:
         if not self._running:
             return
 
-        if self._on_audio_level:
-            try:
-                audio_data = np.frombuffer(indata, dtype=np.int16)
-                level = float(np.abs(audio_data).mean() / 32768.0)
-                self._on_audio_level(level)
-            except RuntimeError as e:
-                # Expected while UI is closing
-                if "main thread is not in main loop" not in str(e):
-                    print(f"Runtime error in audio callback: {e}")
-            except Exception:
-                print("Unexpected error in audio callback:")
-                traceback.print_exc()
+        self._level_countdown -= 1
+        measure_level = self._on_audio_level is not None and frames and self._level_countdown <= 0
+        if measure_level:
+            self._level_countdown = LEVEL_EVERY_N_BLOCKS
 
+        if self._write_idx - self._read_idx >= RING_SLOTS:
+            # Consumer is behind; drop the block like a full queue would
+            if measure_level:
+                self._measure_level(np.frombuffer(indata, dtype=np.int16)[::LEVEL_STRIDE])
+            return
+
+        slot = self._write_idx & RING_MASK
+        size = len(indata)
+        if size > len(self._slots[slot]):
+            self._slots[slot] = bytearray(size)
+            self._level_views[slot] = None
+        memoryview(self._slots[slot])[:size] = indata
+        self._slot_lens[slot] = size
+        self._write_idx += 1
+        self._data_ready.set()
+
+        if measure_level:
+            # The consumer only reads the slot, so it is safe to measure it after publishing
+            samples = self._level_views[slot]
+            if samples is None or size != self._slot_bytes:
+                samples = np.frombuffer(self._slots[slot], dtype=np.int16, count=size // 2)[::LEVEL_STRIDE]
+            self._measure_level(samples)
+
+    def _measure_level(self, samples: np.ndarray):
         try:
-            self.q.put(bytes(indata), block=False)
-        except queue.Full:
-            pass
+            scratch = self._level_scratch
+            if samples.size != scratch.size:
+                if samples.size > scratch.size:
+                    self._level_scratch = scratch = np.empty(samples.size, dtype=np.int32)
+                scratch = scratch[:samples.size]
+            np.abs(samples, out=scratch, dtype=np.int32)
+            level = int(scratch.sum(dtype=np.int64)) / (32768.0 * samples.size)
+            self._level_ema += LEVEL_EMA_ALPHA * (level - self._level_ema)
+            self._on_audio_level(self._level_ema)
+        except RuntimeError as e:
+            # Expected while UI is closing
+            if "main thread is not in main loop" not in str(e):
+                print(f"Runtime error in audio callback: {e}")
+        except Exception:
+            print("Unexpected error in audio callback:")
+            traceback.print_exc()
+
+    def _next_block(self, timeout: float) -> Optional[bytes]:
+        """Returns the oldest captured block, or None if nothing arrived within timeout."""
+        if self._read_idx == self._write_idx:
+            self._data_ready.clear()
+            if self._read_idx == self._write_idx and self._running:
+                self._data_ready.wait(timeout)
+            return None
+
+        slot = self._read_idx & RING_MASK
+        # The strategy queues data asynchronously, so hand it an immutable copy of the slot.
+        data = bytes(memoryview(self._slots[slot])[:self._slot_lens[slot]])
+        self._read_idx += 1
+        return data
+
+    def _is_silent(self, data: bytes) -> bool:
+        samples = np.frombuffer(data, dtype=np.int16)[::LEVEL_STRIDE]
+        if samples.size == 0:
+            return True
+        return float(np.abs(samples, dtype=np.int32).mean()) / 32768.0 < SILENCE_GATE_LEVEL
+
+    def _forward(self, data: bytes):
+        """Queues a block for STT, skipping long runs of silence."""
+        if SILENCE_GATE_LEVEL > 0 and self._is_silent(data):
+            self._silent_blocks += 1
+            if self._silent_blocks > self._hangover_blocks:
+                self._preroll = data
+                return
+        else:
+            self._silent_blocks = 0
+            if self._preroll is not None:
+                self._batch.append(self._preroll)
+                self._batch_bytes += len(self._preroll)
+                self._preroll = None
+        self._batch.append(data)
+        self._batch_bytes += len(data)
+
+    def _flush_batch(self):
+        if not self._batch:
+            return
+        data = self._batch[0] if len(self._batch) == 1 else b"".join(self._batch)
+        self._batch.clear()
+        self._batch_bytes = 0
+        # The silence gate can leave the stream idle long enough for the RPC to end; reopen it
+        # so the held-back audio goes to a live stream instead of being dropped by process().
+        if not self.strategy.is_active:
+            now = time.monotonic()
+            if now - self._last_stream_retry < STREAM_RETRY_SECONDS:
+                return
+            self._last_stream_retry = now
+            print("[AudioListener] STT stream inactive, reopening...")
+            try:
+                self.strategy.reset()
+            except Exception as e:
+                print(f"[AudioListener] Could not reopen STT stream: {e}")
+                return
+        self.strategy.process(data)
 
     def listen(self):
         self._running = True
@@ -89,11 +240,14 @@ class AudioListener:
                 callback=self._callback,
             ):
                 while self._running:
-                    try:
-                        data = self.q.get(timeout=0.5)
-                    except queue.Empty:
+                    data = self._next_block(timeout=IDLE_WAIT_SECONDS)
+                    if data is None:
                         continue
-                    self.strategy.process(data)
+                    self._forward(data)
+                    # Send as soon as the ring is drained, so live audio is not delayed; a
+                    # backlog (e.g. after a stall) goes out as one request of up to MAX_BATCH_SECONDS.
+                    if self._read_idx == self._write_idx or self._batch_bytes >= self._batch_limit:
+                        self._flush_batch()
         except KeyboardInterrupt:
             print("Interrupción recibida en listener. Cerrando sesión...")
         except Exception as e:
@@ -106,10 +260,14 @@ class AudioListener:
         self._thread = threading.Thread(target=self.listen, daemon=True)
         self._thread.start()
 
-    def stop(self):
+    def stop(self, close_strategy: bool = True):
+        """Stops capturing; pass close_strategy=False to hand the STT stream to a new listener."""
         self._running = False
+        self._data_ready.set()  # Wake the listen loop so it sees _running
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
+        if not close_strategy:
+            return
         try:
             self.strategy.close()
         except Exception:
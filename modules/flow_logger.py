@@ -2,8 +2,8 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Tuple
 
 
 def _env_flag(name: str, default: bool = False) -> bool:
@@ -16,14 +16,29 @@ def _env_flag(name: str, default: bool = False) -> bool:
 class JsonLineFormatter(logging.Formatter):
     """Formatter that emits one JSON object per line."""
 
+    # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last record; swapped as one tuple so threads never mix halves
+    _ts_cache: Tuple[int, str] = (-1, "")
+
+    def _iso_ts(self, record: logging.LogRecord) -> str:
+        """UTC ISO-8601 with milliseconds, same shape as datetime.isoformat(timespec="milliseconds")."""
+        second = int(record.created)
+        cached_second, prefix = self._ts_cache
+        if cached_second != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._ts_cache = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         payload: Dict[str, Any] = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "ts": self._iso_ts(record),
             "level": record.levelname,
             "logger": record.name,
         }
 
-        if isinstance(record.msg, dict):
+        fields = getattr(record, "flow_fields", None)
+        if fields is not None:
+            payload.update(fields)
+        elif isinstance(record.msg, dict):
             payload.update(record.msg)
         else:
             payload["message"] = record.getMessage()
@@ -43,10 +58,12 @@ class FlowLogger(logging.LoggerAdapter):
         return FlowLogger(self.logger, merged)
 
     def event(self, event: str, level: int = logging.INFO, **fields: Any) -> None:
-        payload = {"event": event}
-        payload.update(self.extra)
-        payload.update(fields)
-        self.logger.log(level, payload)
+        # Skip building the payload for filtered-out levels (e.g. DEBUG partial events)
+        if not self.logger.isEnabledFor(level):
+            return
+        payload = {"event": event, **self.extra, **fields}
+        # The event name is the plain message; the structured payload rides on the record.
+        self.logger.log(level, event, extra={"flow_fields": payload})
 
 
 _CONFIGURED = False
@@ -0,0 +1,74 @@
+"""Process-wide gRPC channel pools shared by the STT and translation clients."""
+
+import itertools
+import os
+import threading
+
+import grpc
+
+# Independent HTTP/2 connections per service target; RPCs are spread round-robin across them.
+CHANNEL_POOL_SIZE = max(1, int(os.getenv("GRPC_CHANNEL_POOL_SIZE", "4")))
+# Keepalive was meant to keep idle pooled channels (mostly translate, between finals) warm
+# so the first RPC after a pause does not re-dial. That part is given up: pinging a
+# connection with no calls needs keepalive_permit_without_calls on the server, and a stock
+# grpc server also only accepts pings without data every 5 minutes (its minimum receive
+# ping interval, grpc.http2.min_ping_interval_without_data_ms); faster pings get a GOAWAY
+# "too_many_pings" that kills open STT streams too. So pings run only while a call is open,
+# at that 5 minute minimum, which still keeps a long-silent STT stream alive through
+# NATs/proxies; idle channels may go cold and reconnect on their next RPC. Lower
+# GRPC_KEEPALIVE_TIME_MS only together with matching settings on service-stt and the
+# translate service. Audio and text payloads have no size cap.
+CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", int(os.getenv("GRPC_KEEPALIVE_TIME_MS", "300000"))),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+)
+
+
+class _ChannelPool:
+    def __init__(self, target: str, size: int):
+        self.target = target
+        # grpc shares subchannels (TCP connections) between channels through a global pool;
+        # a local subchannel pool per channel keeps each one on its own connection.
+        self.channels = [
+            grpc.insecure_channel(target, options=[*CHANNEL_OPTIONS, ("grpc.use_local_subchannel_pool", 1)])
+            for _ in range(size)
+        ]
+        self._counter = itertools.count()
+
+    def next_index(self) -> int:
+        # next() on itertools.count is atomic under the GIL
+        return next(self._counter) % len(self.channels)
+
+    def next_channel(self) -> grpc.Channel:
+        return self.channels[self.next_index()]
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+
+_pools: dict[str, _ChannelPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_channel_pool(target: str) -> _ChannelPool:
+    """Returns the shared pool for target, creating it on first use."""
+    pool = _pools.get(target)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(target)
+            if pool is None:
+                pool = _ChannelPool(target, CHANNEL_POOL_SIZE)
+                _pools[target] = pool
+    return pool
+
+
+def close_channel_pools():
+    """Closes every pooled channel; only for process shutdown."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
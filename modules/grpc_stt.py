@@ -1,8 +1,8 @@
 import grpc
 import os
 import sys
-import queue
 import threading
+from collections import deque
 
 # Ensure imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,6 +11,14 @@ sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__f
 from protos import stt_pb2
 from protos import stt_pb2_grpc
 from modules.stt.base import STTStrategy, STTResult
+from modules.grpc_channels import get_channel_pool
+
+# Audio chunks buffered while the RPC is stalled (~25 s of 50 ms blocks); the oldest are dropped beyond that.
+AUDIO_QUEUE_MAXLEN = 500
+# process() and _stop_stream() set the ready event, so idle waits only bound a missed wakeup.
+IDLE_WAIT_SECONDS = 5.0
+# Backlogged chunks are merged into one request up to this many bytes (100 ms of 16 kHz int16).
+COALESCE_BYTES = int(os.getenv("STT_COALESCE_BYTES", "3200"))
 
 class GrpcSttStrategy(STTStrategy):
     """
@@ -27,6 +35,8 @@ class GrpcSttStrategy(STTStrategy):
         # Allow override via env var
         host = os.getenv("STT_SERVICE_HOST", host)
         port = os.getenv("STT_SERVICE_PORT", str(port))
+        # Recognition engine run by service-stt (e.g. "vosk", "whisper")
+        strategy = os.getenv("STT_STRATEGY", strategy)
         
         self.target = f"{host}:{port}"
         self.strategy_name = strategy
@@ -35,8 +45,14 @@ class GrpcSttStrategy(STTStrategy):
         
         self.channel = None
         self.stub = None
+        self._call = None
+        self._closed = False
+        # (settings, RecognizeRequest) sent first on every stream; reset() reuses it
+        self._config_cache = None
         
-        self._audio_queue = queue.Queue()
+        # deque append/popleft need no Python-level lock; the Event wakes the request generator.
+        self._audio_queue: deque = deque(maxlen=AUDIO_QUEUE_MAXLEN)
+        self._audio_ready = threading.Event()
         self._stop_event = threading.Event()
         self._send_thread = None
         self._recv_thread = None
@@ -60,7 +76,8 @@ class GrpcSttStrategy(STTStrategy):
             self.model_path = model_path
             
         print(f"[GrpcStt] Connecting to {self.target} (Strategy: {self.strategy_name})...")
-        self.channel = grpc.insecure_channel(self.target)
+        # Each strategy takes the next pooled channel, so parallel streams use separate connections
+        self.channel = get_channel_pool(self.target).next_channel()
         self.stub = stt_pb2_grpc.SttServiceStub(self.channel)
         
         self._start_stream()
@@ -70,84 +87,136 @@ class GrpcSttStrategy(STTStrategy):
             return
             
         self._is_running = True
-        self._stop_event.clear()
+        # Fresh event per stream so a previous stream's generator cannot resume on reset()
+        stop_event = threading.Event()
+        self._stop_event = stop_event
         
         # Generator for the request stream
         def request_generator():
             # 1. Send Config
-            config = stt_pb2.StreamingConfig(
-                strategy=self.strategy_name,
-                model_path=self.model_path or "", # Optional
-                sample_rate=self._sample_rate,
-                language=self.language or ""
-            )
-            yield stt_pb2.RecognizeRequest(config=config)
+            yield self._config_request()
             
             # 2. Send Audio
-            while not self._stop_event.is_set():
+            while not stop_event.is_set():
+                if not self._audio_queue:
+                    self._audio_ready.clear()
+                    if not self._audio_queue:
+                        self._audio_ready.wait(IDLE_WAIT_SECONDS)
+                    continue
                 try:
-                    chunk = self._audio_queue.get(timeout=0.5)
-                    if chunk is None:
-                        # Sentinel to stop
+                    chunk = self._audio_queue.popleft()
+                except IndexError:
+                    continue  # Cleared concurrently by reset()
+                if chunk is None:
+                    # Sentinel to stop
+                    return
+                # Chunks that queued up while the RPC was busy go out as one message; nothing
+                # waits for more audio, so live latency is unchanged.
+                if self._audio_queue and len(chunk) < COALESCE_BYTES:
+                    parts = [chunk]
+                    size = len(chunk)
+                    stopping = False
+                    while self._audio_queue and size < COALESCE_BYTES:
+                        try:
+                            nxt = self._audio_queue.popleft()
+                        except IndexError:
+                            break
+                        if nxt is None:
+                            stopping = True
+                            break
+                        parts.append(nxt)
+                        size += len(nxt)
+                    chunk = b"".join(parts)
+                    if stopping:
+                        yield stt_pb2.RecognizeRequest(audio_content=chunk)
                         return
-                    yield stt_pb2.RecognizeRequest(audio_content=chunk)
-                except queue.Empty:
-                    continue
+                yield stt_pb2.RecognizeRequest(audio_content=chunk)
         
         # Start the bidirectional stream in a background thread to handle responses
-        self._recv_thread = threading.Thread(target=self._receive_loop, args=(request_generator(),), daemon=True)
+        self._recv_thread = threading.Thread(
+            target=self._receive_loop,
+            args=(request_generator(), stop_event),
+            daemon=True,
+        )
         self._recv_thread.start()
 
-    def _receive_loop(self, request_iterator):
+    def _config_request(self):
+        """Returns the config message, rebuilt only when a stream setting changed."""
+        key = (self.strategy_name, self.model_path or "", self._sample_rate, self.language or "")
+        if self._config_cache is None or self._config_cache[0] != key:
+            config = stt_pb2.StreamingConfig(
+                strategy=key[0],
+                model_path=key[1], # Optional
+                sample_rate=key[2],
+                language=key[3]
+            )
+            self._config_cache = (key, stt_pb2.RecognizeRequest(config=config))
+        return self._config_cache[1]
+
+    def _receive_loop(self, request_iterator, stop_event: threading.Event):
         try:
             # This call blocks until the stream ends or error
             response_iterator = self.stub.StreamingRecognize(request_iterator)
+            if not stop_event.is_set():
+                self._call = response_iterator
+            # close() may have run before the call object existed
+            if self._closed:
+                response_iterator.cancel()
+                return
             
+            debug = self._debug_partials
             for response in response_iterator:
-                # Handle response
-                if response.type == "final" and response.is_final:
-                    if self._debug_partials:
-                        print(f"[GrpcStt][FINAL] len={len(response.text)} text='{response.text[:80]}'")
-                    # New sentence committed; reset partial tracking
-                    self._last_partial = ""
-                    self._emit_final(response.text, response.confidence)
-                elif response.type == "partial":
-                    partial = (response.text or "").strip()
+                kind = response.type
+                # Partials outnumber finals by far, so test them first
+                if kind == "partial":
+                    # Proto string fields are never None, and each access builds a new str
+                    partial = response.text.strip()
                     if not partial:
                         continue
 
                     # Avoid UI flicker: ignore duplicates and simple rollbacks from decoder.
-                    if partial == self._last_partial:
-                        if self._debug_partials:
-                            print(f"[GrpcStt][PARTIAL][SKIP duplicate] len={len(partial)}")
-                        continue
-                    if self._last_partial and self._last_partial.startswith(partial):
-                        if self._debug_partials:
-                            print(
-                                f"[GrpcStt][PARTIAL][SKIP rollback] "
-                                f"prev_len={len(self._last_partial)} new_len={len(partial)} "
-                                f"prev='{self._last_partial[:40]}' new='{partial[:40]}'"
-                            )
+                    # Only a partial no longer than the previous one can be either, so the
+                    # common case (decoder extended the hypothesis) costs one length compare.
+                    last = self._last_partial
+                    if len(partial) <= len(last) and last.startswith(partial):
+                        if debug:
+                            if len(partial) == len(last):
+                                print(f"[GrpcStt][PARTIAL][SKIP duplicate] len={len(partial)}")
+                            else:
+                                print(
+                                    f"[GrpcStt][PARTIAL][SKIP rollback] "
+                                    f"prev_len={len(last)} new_len={len(partial)} "
+                                    f"prev='{last[:40]}' new='{partial[:40]}'"
+                                )
                         continue
 
-                    if self._debug_partials:
+                    if debug:
                         print(
-                            f"[GrpcStt][PARTIAL][EMIT] prev_len={len(self._last_partial)} "
+                            f"[GrpcStt][PARTIAL][EMIT] prev_len={len(last)} "
                             f"new_len={len(partial)} text='{partial[:80]}'"
                         )
 
                     self._last_partial = partial
                     self._emit_partial(partial)
+                elif kind == "final" and response.is_final:
+                    text = response.text
+                    if debug:
+                        print(f"[GrpcStt][FINAL] len={len(text)} text='{text[:80]}'")
+                    # New sentence committed; reset partial tracking
+                    self._last_partial = ""
+                    self._emit_final(text, response.confidence)
                 # elif response.type == "current":
                 #    self._emit_current(response.text)
 
         except grpc.RpcError as e:
-            if not self._stop_event.is_set():
+            if not stop_event.is_set():
                 print(f"[GrpcStt] RPC Error: {e}")
         except Exception as e:
             print(f"[GrpcStt] Error in receive loop: {e}")
         finally:
-            self._is_running = False
+            # A stream replaced by reset() must not mark its successor as stopped
+            if self._stop_event is stop_event:
+                self._is_running = False
 
     def process(self, audio_data: bytes) -> None:
         """
@@ -161,7 +230,8 @@ class GrpcSttStrategy(STTStrategy):
              # print("Warning: GrpcStt not running, dropping audio")
              return None
 
-        self._audio_queue.put(audio_data)
+        self._audio_queue.append(audio_data)
+        self._audio_ready.set()
         return None
 
     def reset(self) -> None:
@@ -172,27 +242,31 @@ class GrpcSttStrategy(STTStrategy):
         Simplest is to restart the stream.
         """
         self._stop_stream()
-        # Drain queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._audio_queue.clear()
         self._start_stream()
 
-    def _stop_stream(self):
+    def _stop_stream(self, cancel: bool = False):
+        """Ends the current stream.
+
+        By default the request stream is half-closed so the server can still send the
+        final for audio already sent (reset() relies on this for push-to-talk flushes);
+        cancel=True tears the HTTP/2 stream down at once.
+        """
         self._stop_event.set()
         # Unblock generator
-        self._audio_queue.put(None)
-        if self._recv_thread:
-            # We can't join easily because receive_loop is blocked on stub.StreamingRecognize
-            # cancelling the channel/stream from another thread might be needed.
-            if self.channel:
-                 # This might be too aggressive if we want to reuse channel
-                 # self.channel.close() 
-                 pass
+        self._audio_queue.append(None)
+        self._audio_ready.set()
+        call = self._call
+        self._call = None
+        if cancel and call is not None:
+            call.cancel()
         self._is_running = False
 
+    @property
+    def is_active(self) -> bool:
+        """True while the streaming RPC is open and accepting audio."""
+        return self._is_running
+
     def get_name(self) -> str:
         return f"gRPC-{self.strategy_name}"
 
@@ -200,6 +274,6 @@ class GrpcSttStrategy(STTStrategy):
         return True # It acts as a streaming strategy from the outside
 
     def close(self):
-        self._stop_stream()
-        if self.channel:
-            self.channel.close()
+        # The channel is shared with other clients; cancel only this stream's RPC.
+        self._closed = True
+        self._stop_stream(cancel=True)
@@ -1,6 +1,11 @@
+import asyncio
 import grpc
 import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Tuple
 
 # Ensure we can import from protos which is in the parent directory
 # modules/grpc_translator.py -> parent is modules/ -> parent is service_agent_voice/
@@ -9,6 +14,21 @@ sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__f
 
 from protos import translate_pb2
 from protos import translate_pb2_grpc
+from modules.grpc_channels import get_channel_pool
+
+# Live captions repeat short phrases ("okay", "thank you", re-emitted finals), so recent
+# results are kept process-wide, shared by every client instance.
+TRANSLATION_CACHE_SIZE = 1024
+# Longer texts are one-off sentences; caching them would only evict the short repeats.
+TRANSLATION_CACHE_MAX_TEXT = 200
+
+_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# One client per language pair, shared by every session of the process
+_shared: "dict[Tuple[str, str], GrpcTranslator]" = {}
+_shared_lock = threading.Lock()
+
 
 class GrpcTranslator:
     def __init__(self, source_lang="en", target_lang="es", host="127.0.0.1", port=5001):
@@ -20,26 +40,88 @@ class GrpcTranslator:
         
         self.target = f"{host}:{port}"
         print(f"Connecting to Translation Service at {self.target}...")
-        self.channel = grpc.insecure_channel(self.target)
-        self.stub = translate_pb2_grpc.TranslationServiceStub(self.channel)
+        # Channels are shared process-wide; a Translate callable per pooled channel lets
+        # concurrent translations run on separate connections instead of queueing on one.
+        # Keeping the bound multicallables skips the stub attribute lookups on every call.
+        self._pool = get_channel_pool(self.target)
+        self._translate_calls = [
+            translate_pb2_grpc.TranslationServiceStub(channel).Translate for channel in self._pool.channels
+        ]
+
+    @classmethod
+    def shared(cls, source_lang: str = "en", target_lang: str = "es") -> "GrpcTranslator":
+        """Returns the process-wide client for a language pair, creating it on first use."""
+        key = (source_lang, target_lang)
+        translator = _shared.get(key)
+        if translator is None:
+            with _shared_lock:
+                translator = _shared.get(key)
+                if translator is None:
+                    translator = cls(source_lang=source_lang, target_lang=target_lang)
+                    _shared[key] = translator
+        return translator
 
     def translate(self, text: str) -> str:
+        return self.translate_result(self.translate_async(text), text)
+
+    def translate_async(self, text: str) -> Optional[Future]:
+        """Starts the RPC without blocking; pass the future and text to translate_result()."""
         if not text:
+            return None
+        if len(text) <= TRANSLATION_CACHE_MAX_TEXT:
+            key = (self.source_lang, self.target_lang, text)
+            with _cache_lock:
+                cached = _cache.get(key)
+                if cached is not None:
+                    _cache.move_to_end(key)
+            if cached is not None:
+                future = Future()
+                future.set_result(translate_pb2.TranslateResponse(translated_text=cached))
+                return future
+        request = translate_pb2.TranslateRequest(
+            text=text,
+            source_lang=self.source_lang,
+            target_lang=self.target_lang
+        )
+        return self._translate_calls[self._pool.next_index()].future(request)
+
+    def translate_result(self, future: Optional[Future], text: str) -> str:
+        """Waits for a translate_async() call; falls back to the original text on RPC failure."""
+        if future is None:
             return ""
         try:
-            request = translate_pb2.TranslateRequest(
-                text=text,
-                source_lang=self.source_lang,
-                target_lang=self.target_lang
-            )
-            # Synchronous call
-            response = self.stub.Translate(request)
-            return response.translated_text
+            translated = future.result().translated_text
         except grpc.RpcError as e:
             status = e.code().name if hasattr(e, "code") else "UNKNOWN"
             details = e.details() if hasattr(e, "details") else str(e)
             print(f"[GrpcTranslator] RPC to {self.target} failed ({status}): {details}")
             return text
 
+        if translated and len(text) <= TRANSLATION_CACHE_MAX_TEXT:
+            key = (self.source_lang, self.target_lang, text)
+            with _cache_lock:
+                _cache[key] = translated
+                _cache.move_to_end(key)
+                if len(_cache) > TRANSLATION_CACHE_SIZE:
+                    _cache.popitem(last=False)
+        return translated
+
+    async def translate_aio(self, text: str) -> str:
+        """Awaitable translate() for asyncio callers; no worker thread is tied up while the RPC runs."""
+        future = self.translate_async(text)
+        if future is None:
+            return ""
+        if not future.done():
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+
+            def wake(_):
+                loop.call_soon_threadsafe(lambda: waiter.done() or waiter.set_result(None))
+
+            future.add_done_callback(wake)
+            await waiter
+        return self.translate_result(future, text)
+
     def close(self):
-        self.channel.close()
+        # Pooled channels outlive this client; see grpc_channels.close_channel_pools
+        pass
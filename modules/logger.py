@@ -1,5 +1,7 @@
 import os
 import datetime
+import queue
+import threading
 
 class TranscriptionLogger:
     def __init__(self, output_dir="output"):
@@ -12,12 +14,35 @@ class TranscriptionLogger:
         self.output_file = os.path.join(self.output_dir, f"transcripcion_{timestamp}.txt")
         print(f"Guardando transcripción en: {self.output_file}")
 
+        # Las escrituras van a un hilo propio con el archivo abierto una sola vez,
+        # así el hilo que publica los finales no espera al disco.
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._thread.start()
+
     def log(self, eng, esp):
-        """Guarda la transcripción en el archivo de texto."""
-        try:
-            with open(self.output_file, "a", encoding="utf-8") as f:
-                f.write(f"EN: {eng}\n")
-                f.write(f"ES: {esp}\n")
-                f.write("-" * 20 + "\n")
-        except Exception as e:
-            print(f"Error escribiendo en archivo: {e}")
+        """Encola la transcripción para guardarla en el archivo de texto."""
+        self._queue.put(f"EN: {eng}\nES: {esp}\n{'-' * 20}\n")
+
+    def _writer_loop(self):
+        f = None
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            try:
+                if f is None:
+                    f = open(self.output_file, "a", encoding="utf-8")
+                f.write(entry)
+                # Vaciar el buffer solo cuando no quedan entradas pendientes
+                if self._queue.empty():
+                    f.flush()
+            except Exception as e:
+                print(f"Error escribiendo en archivo: {e}")
+        if f is not None:
+            f.close()
+
+    def close(self):
+        """Escribe lo pendiente y cierra el archivo."""
+        self._queue.put(None)
+        self._thread.join(timeout=2.0)
@@ -1,4 +1,7 @@
 import os
+import threading
+import time
+import urllib.error
 import urllib.request
 import zipfile
 import shutil
@@ -6,6 +9,18 @@ import shutil
 # https://alphacephei.com/vosk/models
 
 MODELS_DIR = "./models"
+# Models are hundreds of MB; move them in large chunks to keep the Python loop short.
+COPY_CHUNK_SIZE = 1 << 20
+# Large models are fetched as byte ranges over several connections when the server allows it.
+PARALLEL_DOWNLOAD_MIN_BYTES = 64 << 20
+DOWNLOAD_CONNECTIONS = 4
+# The progress bar is redrawn at most this often.
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+# Model paths already verified/installed by ensure_model during this process
+_READY_MODEL_PATHS: set[str] = set()
+# Model names found under MODELS_DIR by is_model_downloaded (menus re-check them on every render)
+_DOWNLOADED_MODELS: set[str] = set()
 
 AVAILABLE_MODELS = {
     "1": {
@@ -41,45 +56,174 @@ AVAILABLE_MODELS = {
 }
 
 
+def _scan_downloaded_models():
+    """Lee MODELS_DIR una sola vez y reemplaza _DOWNLOADED_MODELS con los modelos encontrados."""
+    try:
+        with os.scandir(MODELS_DIR) as entries:
+            found = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        found = set()
+    # A full scan is authoritative, so models deleted from disk drop out of the set
+    _DOWNLOADED_MODELS.clear()
+    _DOWNLOADED_MODELS.update(found)
+    return _DOWNLOADED_MODELS
+
+
 def is_model_downloaded(model_name):
     """Verifica si el modelo está descargado."""
-    model_path = os.path.join(MODELS_DIR, model_name)
-    return os.path.isdir(model_path)
+    # Hits are answered from the last scan without touching the disk, so a model deleted
+    # since then still reads as downloaded until the next full scan (get_models_info).
+    # Misses always rescan, so a model downloaded later is picked up.
+    if model_name in _DOWNLOADED_MODELS:
+        return True
+    return model_name in _scan_downloaded_models()
 
 
 def get_models_info():
     """Retorna una lista con la informacion de los modelos y si estan descargados."""
     info = []
+    downloaded = _scan_downloaded_models()
     for key, model in AVAILABLE_MODELS.items():
         info.append({
             "id": key,
             "name": model["name"],
             "lang": model["lang"],
             "code": model.get("code", "en"),
-            "downloaded": is_model_downloaded(model["name"])
+            "downloaded": model["name"] in downloaded
         })
     return info
 
 
 def download_with_progress(url, dest_path):
     """Descarga archivo mostrando progreso."""
-    def report_progress(block_num, block_size, total_size):
-        downloaded = block_num * block_size
-        percent = min(100, downloaded * 100 / total_size)
-        bar_len = 30
-        filled = int(bar_len * percent / 100)
-        bar = "█" * filled + "░" * (bar_len - filled)
-        print(f"\r  Descargando: [{bar}] {percent:.1f}%", end="", flush=True)
-    
-    urllib.request.urlretrieve(url, dest_path, reporthook=report_progress)
+    progress_lock = threading.Lock()
+    downloaded = 0
+    last_print = 0.0
+
+    def report_progress(nbytes, total_size):
+        nonlocal downloaded, last_print
+        with progress_lock:
+            downloaded += nbytes
+            # Redraw at most every PROGRESS_INTERVAL_SECONDS; always draw the final 100%
+            now = time.monotonic()
+            if now - last_print < PROGRESS_INTERVAL_SECONDS and downloaded != total_size:
+                return
+            last_print = now
+            if total_size <= 0:
+                print(f"\r  Descargando: {downloaded / (1 << 20):.1f} MB", end="", flush=True)
+                return
+            percent = min(100, downloaded * 100 / total_size)
+            bar_len = 30
+            filled = int(bar_len * percent / 100)
+            bar = "█" * filled + "░" * (bar_len - filled)
+            print(f"\r  Descargando: [{bar}] {percent:.1f}%", end="", flush=True)
+
+    # A HEAD decides between ranged and single-stream download, so no GET is opened and thrown away
+    total_size, ranged = _probe_download(url)
+    if ranged:
+        try:
+            _download_ranges(url, dest_path, total_size, lambda n: report_progress(n, total_size))
+            print()
+            return
+        except Exception as e:
+            print(f"\n  Descarga por rangos fallida ({e}); reintentando en una sola conexión...")
+            downloaded = 0
+    _download_single(url, dest_path, report_progress)
     print()
 
 
+def _download_single(url, dest_path, report_progress):
+    """Descarga el archivo con un único GET."""
+    # Models are already zipped; ask for the raw bytes
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    with urllib.request.urlopen(request) as response, open(dest_path, "wb") as f:
+        total_size = int(response.headers.get("Content-Length") or 0)
+        while True:
+            chunk = response.read(COPY_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            report_progress(len(chunk), total_size)
+
+
+def _probe_download(url):
+    """Devuelve (tamaño, admite rangos) según un HEAD; (0, False) si el servidor no lo responde."""
+    request = urllib.request.Request(url, method="HEAD", headers={"Accept-Encoding": "identity"})
+    try:
+        with urllib.request.urlopen(request) as response:
+            total_size = int(response.headers.get("Content-Length") or 0)
+            accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+    except (urllib.error.URLError, ValueError):
+        return 0, False
+    return total_size, total_size >= PARALLEL_DOWNLOAD_MIN_BYTES and accepts_ranges
+
+
+def _download_ranges(url, dest_path, total_size, on_bytes):
+    """Descarga el archivo en DOWNLOAD_CONNECTIONS rangos paralelos escritos en su posición."""
+    with open(dest_path, "wb") as f:
+        f.truncate(total_size)
+
+    part_size = -(-total_size // DOWNLOAD_CONNECTIONS)
+    errors = []
+    # Set by the first failing range so the others stop instead of downloading to the end
+    failed = threading.Event()
+
+    def fetch(start, end):
+        try:
+            headers = {"Accept-Encoding": "identity", "Range": f"bytes={start}-{end}"}
+            request = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(request) as response, open(dest_path, "r+b") as f:
+                if response.status != 206:
+                    raise RuntimeError(f"Server ignored range request (HTTP {response.status})")
+                f.seek(start)
+                received = 0
+                while not failed.is_set():
+                    chunk = response.read(COPY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    received += len(chunk)
+                    on_bytes(len(chunk))
+            if failed.is_set():
+                return
+            if received != end - start + 1:
+                raise RuntimeError(f"Incomplete range {start}-{end}: {received} bytes")
+        except Exception as e:
+            errors.append(e)
+            failed.set()
+
+    threads = [
+        threading.Thread(target=fetch, args=(start, min(start + part_size, total_size) - 1), daemon=True)
+        for start in range(0, total_size, part_size)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _extract_zip(zip_path, dest_dir):
+    """Extrae el zip miembro a miembro, copiando en bloques grandes."""
+    dest_root = os.path.realpath(dest_dir)
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member in zip_ref.infolist():
+            target = os.path.realpath(os.path.join(dest_root, member.filename))
+            if target != dest_root and not target.startswith(dest_root + os.sep):
+                raise RuntimeError(f"Unsafe path in archive: {member.filename}")
+            if member.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with zip_ref.open(member) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+
+
 def extract_model(zip_path):
     """Extrae el modelo del zip."""
     print("  Extrayendo...")
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(MODELS_DIR)
+    _extract_zip(zip_path, MODELS_DIR)
     os.remove(zip_path)
     print("  ✓ Modelo listo")
 
@@ -100,9 +244,17 @@ def ensure_model(model_path: str):
     Checks if the model exists, if not, tries to download it.
     Uses the logic from audio_listener but adapted to use existing helpers.
     """
-    if os.path.exists(model_path) and os.path.isdir(model_path):
-        if any(os.scandir(model_path)):
-            return
+    if model_path in _READY_MODEL_PATHS:
+        return
+
+    # scandir alone tells both "exists as a directory" and "is not empty"
+    try:
+        with os.scandir(model_path) as entries:
+            if any(entries):
+                _READY_MODEL_PATHS.add(model_path)
+                return
+    except (FileNotFoundError, NotADirectoryError):
+        pass
     
     print(f"Model not found at {model_path}. Attempting to download...")
     
@@ -124,17 +276,14 @@ def ensure_model(model_path: str):
         print(f"Downloading from {url}...")
         download_with_progress(url, zip_path)
         
-        # extract_model function in this file hardcodes extraction to MODELS_DIR.
-        # We need to extract to base_dir.
-        # So we should probably modify extract_model or just do the extraction here to be safe and flexible.
-        # Let's use the explicit extraction here to support any base_dir.
+        # extract_model hardcodes MODELS_DIR; extract to base_dir to support any location.
         print("Extracting model...")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(base_dir if base_dir else ".")
+        _extract_zip(zip_path, base_dir if base_dir else ".")
         
         if os.path.exists(zip_path):
             os.remove(zip_path)
             
+        _READY_MODEL_PATHS.add(model_path)
         print(f"Model '{model_name}' successfully installed.")
         
     except Exception as e:
@@ -147,8 +296,9 @@ def select_vosk_model():
     """Muestra menú para seleccionar modelo Vosk."""
     print("\n=== Modelos Vosk Disponibles ===\n")
     
+    downloaded = _scan_downloaded_models()
     for key, model in AVAILABLE_MODELS.items():
-        status = "✓" if is_model_downloaded(model["name"]) else "○"
+        status = "✓" if model["name"] in downloaded else "○"
         print(f"  [{key}] {status} {model['lang']} - {model['name']}")
     
     print("\n  ✓ = descargado, ○ = no descargado\n")
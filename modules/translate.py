@@ -1,5 +1,5 @@
-import queue
 import threading
+from collections import deque
 from typing import Callable, Optional
 
 from modules.grpc_translator import GrpcTranslator
@@ -13,7 +13,10 @@ class Translator:
         self.target_lang = target_lang
         self.client = GrpcTranslator(source_lang=source_lang, target_lang=target_lang)
 
-        self.queue: queue.Queue[str] = queue.Queue()
+        # Only the newest text matters (older ones are superseded partials): a one-slot
+        # deque drops the rest on append, and the Event wakes the worker.
+        self._latest: deque = deque(maxlen=1)
+        self._has_item = threading.Event()
         self.running = False
         self.thread: Optional[threading.Thread] = None
 
@@ -22,8 +25,21 @@ class Translator:
             return ""
         if self.source_lang == self.target_lang:
             return text
+        # GrpcTranslator keeps the LRU of recent results
         return self.client.translate(text)
 
+    def translate_async(self, text: str):
+        """Starts translating without blocking; returns None when there is nothing to send."""
+        if not text or self.source_lang == self.target_lang:
+            return None
+        return self.client.translate_async(text)
+
+    def translate_result(self, future, text: str) -> str:
+        """Waits for translate_async(); texts that needed no RPC come back unchanged."""
+        if future is None:
+            return text
+        return self.client.translate_result(future, text)
+
     def start_worker(self, on_text_ready: Optional[Callable], on_translation_ready: Optional[Callable]):
         self.running = True
         self.thread = threading.Thread(
@@ -35,27 +51,26 @@ class Translator:
 
     def stop_worker(self):
         self.running = False
+        self._has_item.set()
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=1.0)
 
     def enqueue(self, text: str):
         if self.running and text:
-            self.queue.put(text)
+            self._latest.append(text)
+            self._has_item.set()
 
     def _worker_loop(self, on_text_ready: Optional[Callable], on_translation_ready: Optional[Callable]):
         while self.running:
-            try:
-                text = self.queue.get(timeout=0.5)
-            except queue.Empty:
+            if not self._latest:
+                self._has_item.clear()
+                if not self._latest and self.running:
+                    # enqueue() and stop_worker() both set the event, so no polling timeout is needed
+                    self._has_item.wait()
                 continue
-
-            while not self.queue.empty():
-                try:
-                    text = self.queue.get_nowait()
-                except queue.Empty:
-                    break
-
-            if not text:
+            try:
+                text = self._latest.popleft()
+            except IndexError:
                 continue
 
             if on_text_ready:
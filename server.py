@@ -191,8 +191,8 @@ async def websocket_endpoint(
         voice_id=voice_id,
     )
 
-    # Create a local translator cache for this connection only
-    # This ensures a fresh context and model loading for each session
+    # Per-connection map of translators; the clients themselves are the process-wide
+    # GrpcTranslator.shared() instances, so a new session opens no new connections
     local_translator_cache = {}
 
     # Initialize audio service
@@ -3,6 +3,7 @@ import os
 import threading
 import queue
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Callable, Dict
 from modules.grpc_stt import GrpcSttStrategy
@@ -29,6 +30,8 @@ def _ts():
 
 AGENT_HISTORY_LIMIT = 5
 TURN_SILENCE_TIMEOUT = 4.0  # seconds of silence before flushing turn to LLM
+# Only filter specific known hallucinations to avoid blocking legitimate one-word commands (like "Stop", "Yes")
+SILENT_HALLUCINATIONS = frozenset({"the", "a", "an", "and", "but", "or", "so", "of", "to"})
 
 
 class AudioService:
@@ -103,6 +106,10 @@ class AudioService:
         self._last_partial_text: str = ""
         self._debug_partials = os.getenv("STT_DEBUG_PARTIALS", "").lower() in {"1", "true", "yes", "on"}
 
+        # Final translations run here so the STT receive thread keeps delivering partials;
+        # a single worker preserves the order of finals and of the partials sent after them.
+        self._final_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="final-translate")
+
     def _flow(self, event: str, level: int = logging.INFO, **fields):
         if not self.flow_logger:
             return
@@ -150,6 +157,7 @@ class AudioService:
         self._flow(
             "stt.stream_initialized",
             strategy="grpc-vosk",
+            engine=self.processor.strategy_name,
             sample_rate=self.sample_rate,
         )
         
@@ -163,7 +171,7 @@ class AudioService:
             
             if translator_key not in self.translator_cache:
                 print(f"[{_ts()}] Initializing translator for {translator_key}...")
-                self.translator_cache[translator_key] = EnglishToSpanishTranslator(
+                self.translator_cache[translator_key] = EnglishToSpanishTranslator.shared(
                     source_lang=self.input_lang_code,
                     target_lang=self.output_lang
                 )
@@ -395,6 +403,15 @@ class AudioService:
         self._flow("conversation.cleared", cleared_items=history_items)
 
     def shutdown(self):
+        self._final_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Cancel the STT stream; otherwise its RPC stays open after the websocket is gone
+        if self.processor:
+            try:
+                self.processor.close()
+            except Exception as e:
+                print(f"Error closing STT stream: {e}")
+
         # Cancel turn timer
         with self._turn_lock:
             if self._turn_timer:
@@ -637,18 +654,32 @@ class AudioService:
         if not text or len(text.strip()) == 0:
             return
         # Vosk 'hallucinations' on silence often have 0 confidence and are short stop words
-        # Only filter specific known hallucinations to avoid blocking legitimate one-word commands (like "Stop", "Yes")
-        hallucinations = {"the", "a", "an", "and", "but", "or", "so", "of", "to"}
-        if confidence == 0.0 and text.strip().lower() in hallucinations:
+        if confidence == 0.0 and text.strip().lower() in SILENT_HALLUCINATIONS:
             print(f"[{_ts()}] Ignoring silent hallucination: '{text}'")
             return
 
+        # Start the translation RPC right away so consecutive finals overlap on the wire;
+        # the executor still publishes them one by one, in order.
+        translation = None
+        if self.translator:
+            try:
+                translation = self.translator.translate_async(text)
+            except Exception as e:
+                print(f"[{_ts()}] Translation error: {e}")
+
+        try:
+            self._final_executor.submit(self._publish_final, text, confidence, translation)
+        except RuntimeError:
+            pass  # Service already shut down
+
+    def _publish_final(self, text: str, confidence: float, translation=None):
+        """Waits for a final's translation and forwards it (runs on the final executor)."""
         try:
             print(f"[{_ts()}] Final ({self.input_lang_code}): {text}")
             
             translated_text = text  # Default to original if no translation
-            if self.translator:
-                translated_text = self.translator.translate(text)
+            if translation is not None and self.translator:
+                translated_text = self.translator.translate_result(translation, text)
             
             message = {
                 "type": "final",
@@ -683,14 +714,13 @@ class AudioService:
                 print(f"[{_ts()}] [PARTIAL][SKIP empty]")
             return
 
-        # Ignore duplicate partials
-        if partial_text == self._last_partial_text:
-            if self._debug_partials:
-                print(f"[{_ts()}] [PARTIAL][SKIP duplicate] len={len(partial_text)}")
-            return
-
-        # Ignore decoder rollbacks to avoid UI flicker on trailing words
-        if self._last_partial_text and self._last_partial_text.startswith(partial_text):
+        # Ignore duplicates and decoder rollbacks to avoid UI flicker on trailing words.
+        # Both require the new partial to be no longer than the previous one.
+        if len(partial_text) <= len(self._last_partial_text) and self._last_partial_text.startswith(partial_text):
+            if len(partial_text) == len(self._last_partial_text):
+                if self._debug_partials:
+                    print(f"[{_ts()}] [PARTIAL][SKIP duplicate] len={len(partial_text)}")
+                return
             if self._debug_partials:
                 print(
                     f"[{_ts()}] [PARTIAL][SKIP rollback] "
@@ -720,7 +750,13 @@ class AudioService:
         }
         
         if self._on_partial:
-            self._on_partial(message)
+            # Sent through the final executor so a partial of the next utterance never reaches
+            # the client before a final still waiting on its translation (the web client drops
+            # the live partial when a final arrives). With no final pending it goes out at once.
+            try:
+                self._final_executor.submit(self._on_partial, message)
+            except RuntimeError:
+                pass  # Service already shut down
     
     async def process_audio(self, data: bytes):
         """
@@ -732,8 +768,10 @@ class AudioService:
         if not self.processor:
             raise RuntimeError("AudioService not initialized. Call setup() first.")
         
-        # Process audio in background thread (Vosk is blocking)
-        await asyncio.to_thread(self.processor.process, data)
+        # GrpcSttStrategy.process only queues the chunk for the gRPC sender thread, so it is
+        # called inline: a thread-pool hop per chunk would cost more than the call itself and
+        # would make every session contend for the shared default executor.
+        self.processor.process(data)
 
     def flush_utterance(self) -> bool:
         """
@@ -145,12 +145,8 @@ class TranslatorService:
 
     async def _perform_translation(self, text: str, source_lang: str, target_lang: str) -> str:
         key = f"{source_lang}-{target_lang}"
-        translator = GrpcTranslator(source_lang=source_lang, target_lang=target_lang)
-        # Translator is sync gRPC call
-        try:
-            result = await asyncio.to_thread(translator.translate, text)
-        finally:
-             translator.close()
+        translator = GrpcTranslator.shared(source_lang=source_lang, target_lang=target_lang)
+        result = await translator.translate_aio(text)
         return result
 
     async def _perform_tts(self, text: str, language: str, voice_id: str, format: str) -> Optional[Dict[str, Any]]:
@@ -2,9 +2,11 @@ import tkinter as tk
 from tkinter import ttk
 import sounddevice as sd
 import os
+import threading
 import traceback
 
 WIDTH_SIZE = 600
+AUDIO_LEVEL_REFRESH_MS = 33  # ~30 Hz meter redraw
 from modules.model_selector import AVAILABLE_MODELS, MODELS_DIR
 
 
@@ -19,6 +21,15 @@ class Page:
         self._on_config_change = None
         self._on_close = None
         
+        # Latest audio level written by the audio thread, drawn by the UI pump
+        self._audio_level = 0.0
+        self._drawn_audio_level: float | None = None
+
+        # Latest text per Text widget waiting for the UI thread; partials that arrive
+        # before it runs collapse into one redraw.
+        self._pending_text: dict = {}
+        self._pending_lock = threading.Lock()
+
         # Config params
         self.latency_var = tk.DoubleVar(value=0.05)  # Default 50ms
         
@@ -234,14 +245,19 @@ class Page:
         self._schedule_ui(update)
     
     def update_audio_level(self, level):
-        """Actualiza la barra de nivel de audio (0.0-1.0) - thread-safe."""
-        def update():
+        """Registra el nivel de audio (0.0-1.0) - thread-safe, sin tocar Tk."""
+        self._audio_level = level
+
+    def _pump_audio_level(self):
+        """Redibuja la barra de nivel a ~30 Hz con el último valor recibido."""
+        if self._is_closing:
+            return
+        level = self._audio_level
+        if level != self._drawn_audio_level:
             try:
-                if self._is_closing:
-                    return
                 width = self.audio_level_canvas.winfo_width()
                 bar_width = int(width * min(level * 3, 1.0))  # Amplificar x3 para mejor visualización
-                
+
                 # Color según nivel
                 if level > 0.3:
                     color = "green"
@@ -249,13 +265,13 @@ class Page:
                     color = "yellow"
                 else:
                     color = "gray40"
-                
+
                 self.audio_level_canvas.coords(self.audio_level_bar, 0, 0, bar_width, 20)
                 self.audio_level_canvas.itemconfig(self.audio_level_bar, fill=color)
-            except:
-                pass  # Ignorar si la ventana está cerrada
-
-        self._schedule_ui(update)
+                self._drawn_audio_level = level
+            except tk.TclError:
+                return  # Ventana cerrada
+        self.root.after(AUDIO_LEVEL_REFRESH_MS, self._pump_audio_level)
 
     def _create_top_section(self):
         container = tk.Frame(self.main_paned)
@@ -280,9 +296,6 @@ class Page:
         self.history_text.tag_config("esp", foreground="blue", font=("Arial", 10, "italic"))
         self.history_text.tag_config("sep", foreground="gray", font=("Arial", 6))
 
-    def on_frame_configure(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
     def _create_bottom_section(self):
         """Crea sección inferior con cuadros redimensionables."""
         # PanedWindow vertical interior
@@ -330,10 +343,13 @@ class Page:
                 if conf_percent > 0:
                     eng_text = f"{eng} [{conf_percent}%]"
             
-            # Insertar en el Text widget
-            self.history_text.insert(tk.END, f"{eng_text}\n", "eng")
-            self.history_text.insert(tk.END, f"{esp}\n", "esp")
-            self.history_text.insert(tk.END, f"{'-'*40}\n", "sep")
+            # Insertar en el Text widget (una sola llamada a Tcl para los tres tramos)
+            self.history_text.insert(
+                tk.END,
+                f"{eng_text}\n", "eng",
+                f"{esp}\n", "esp",
+                f"{'-'*40}\n", "sep",
+            )
             
             self.history_text.see(tk.END)  # Auto-scroll
             self.history_text.config(state="disabled")
@@ -341,59 +357,60 @@ class Page:
         self._schedule_ui(update)
 
     def update_current_text(self, text):
-        def update():
-            if self._is_closing:
-                return
-            self.english_current_text.config(state="normal")
-            self.english_current_text.delete("1.0", tk.END)
-            self.english_current_text.insert(tk.END, text)
-            self.english_current_text.config(state="disabled")
-
-        self._schedule_ui(update)
+        self._set_text_latest(self.english_current_text, text)
 
     def clear_current_text(self):
         """Limpia el cuadro de texto original (realtime)."""
-        def update():
-            if self._is_closing:
-                return
-            self.english_current_text.config(state="normal")
-            self.english_current_text.delete("1.0", tk.END)
-            self.english_current_text.config(state="disabled")
-
-        self._schedule_ui(update)
+        self._set_text_latest(self.english_current_text, "")
 
     def update_second_text(self, text):
-        def update():
-            if self._is_closing:
-                return
-            self.second_text.config(state="normal")
-            self.second_text.delete("1.0", tk.END)
-            self.second_text.insert(tk.END, text)
-            self.second_text.config(state="disabled")
-
-        self._schedule_ui(update)
+        self._set_text_latest(self.second_text, text)
+
+    def _set_text_latest(self, widget, text):
+        """Replaces the widget content; only the last text set before the UI runs is drawn."""
+        with self._pending_lock:
+            scheduled = widget in self._pending_text
+            self._pending_text[widget] = text
+        if not scheduled and not self._schedule_ui(lambda: self._flush_text(widget)):
+            # Nothing will flush this entry; leaving it would block every later update
+            with self._pending_lock:
+                self._pending_text.pop(widget, None)
+
+    def _flush_text(self, widget):
+        with self._pending_lock:
+            text = self._pending_text.pop(widget, None)
+        if text is None or self._is_closing:
+            return
+        widget.config(state="normal")
+        widget.delete("1.0", tk.END)
+        if text:
+            widget.insert(tk.END, text)
+        widget.config(state="disabled")
 
     @property
     def is_closing(self) -> bool:
         return self._is_closing
 
-    def _schedule_ui(self, callback):
+    def _schedule_ui(self, callback) -> bool:
+        """Runs callback on the UI thread; returns False when it was dropped instead."""
         if self._is_closing:
-            return
+            return False
         if not self._mainloop_running:
             try:
                 callback()
             except (RuntimeError, tk.TclError):
-                pass
-            return
+                return False
+            return True
         try:
             self.root.after(0, callback)
         except (RuntimeError, tk.TclError):
             # RuntimeError: "main thread is not in main loop"
-            pass
+            return False
+        return True
 
     def run(self):
         self._mainloop_running = True
+        self.root.after(AUDIO_LEVEL_REFRESH_MS, self._pump_audio_level)
         try:
             self.root.mainloop()
         finally: